@@ -0,0 +1,252 @@
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from bson import ObjectId
+from bson.binary import Binary
+from dotenv import load_dotenv
+from pymongo import MongoClient, UpdateOne
+
+# Keeps rolling units-needed totals per city x blood type in fixed-size ring buffers
+# (hourly and daily), fed only by blood requests created since the last pass, and
+# writes one summary document per city x blood type with recent totals and a short
+# forecast. Dashboards read the summaries instead of rescanning bloodrequests.
+#
+# ObjectIds from several backend instances are not inserted in strictly increasing
+# order, so each pass re-reads the last FORECAST_OVERLAP_SECONDS of ids and skips the
+# ones already counted. Inserts committed later than that are still missed.
+#
+# datePosted comes from the client, so a request is bucketed at its datePosted capped
+# at its creation time; a future date can never push the windows ahead of the clock.
+
+# Load .env variables
+load_dotenv()
+
+db_name = os.getenv("MONGO_DB", "test")
+forecast_interval = float(os.getenv("FORECAST_INTERVAL", "60"))
+overlap_seconds = float(os.getenv("FORECAST_OVERLAP_SECONDS", "300"))
+
+# Same order as the enum in models/bloodRequestModel.js
+BLOOD_TYPES = ['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-']
+
+# location is free text; only these cities get their own row, everything else is "Other"
+# so the buffers (and the saved state document) stay a fixed size
+CITIES = [
+    'Lahore', 'Karachi', 'Islamabad', 'Rawalpindi', 'Peshawar',
+    'Multan', 'Faisalabad', 'Hyderabad', 'Quetta', 'Sialkot',
+    'Gujranwala', 'Mardan', 'Sukkur', 'Bahawalpur', 'Larkana',
+    'Other'
+]
+
+HOURLY_SLOTS = 24 * 7
+DAILY_SLOTS = 90
+STATE_ID = "rolling"
+
+
+class RingBuffer:
+    """
+    Units needed per (city, blood type, time bucket) for the last `slots` buckets.
+    `head` is the absolute index of the newest bucket (e.g. hours since the epoch).
+    """
+
+    def __init__(self, slots, cities=0, head=None, data=None):
+        self.slots = slots
+        self.head = head
+        self.data = data if data is not None else np.zeros((cities, len(BLOOD_TYPES), slots), dtype=np.int32)
+
+    def advance(self, bucket):
+        """Move the head forward to `bucket`, clearing the slots that fall out of the window."""
+        if self.head is None:
+            self.head = bucket
+            return
+        steps = bucket - self.head
+        if steps <= 0:
+            return
+        if steps >= self.slots:
+            self.data[:] = 0
+        else:
+            cleared = (self.head + 1 + np.arange(steps)) % self.slots
+            self.data[:, :, cleared] = 0
+        self.head = bucket
+
+    def add(self, city_idx, type_idx, buckets, units):
+        if len(buckets) == 0:
+            return
+        self.advance(int(buckets.max()))
+        # Requests older than the window are dropped
+        keep = buckets > self.head - self.slots
+        np.add.at(self.data, (city_idx[keep], type_idx[keep], buckets[keep] % self.slots), units[keep])
+
+    def series(self):
+        """Buckets ordered oldest -> newest along the last axis."""
+        return np.roll(self.data, -((self.head + 1) % self.slots), axis=2)
+
+
+def holt_forecast(series, horizon, alpha, beta, damping=0.8):
+    """
+    Damped-trend Holt smoothing over the last axis, vectorized over every city x blood type.
+    Returns the expected total for the next `horizon` buckets.
+    """
+    level = series[..., 0].astype(np.float64)
+    trend = np.zeros_like(level)
+    for t in range(1, series.shape[-1]):
+        previous_level = level
+        level = alpha * series[..., t] + (1 - alpha) * (level + damping * trend)
+        trend = beta * (level - previous_level) + (1 - beta) * damping * trend
+    # Damping keeps a short burst from being extrapolated linearly over the whole horizon
+    trend_weights = np.cumsum(damping ** np.arange(1, horizon + 1))
+    return np.clip(level[..., None] + trend[..., None] * trend_weights, 0, None).sum(axis=-1)
+
+
+class DemandAggregates:
+    def __init__(self):
+        self.cities = list(CITIES)
+        self.city_index = {city.lower(): i for i, city in enumerate(self.cities)}
+        self.hourly = RingBuffer(HOURLY_SLOTS, cities=len(self.cities))
+        self.daily = RingBuffer(DAILY_SLOTS, cities=len(self.cities))
+        # Newest ObjectId creation time seen, and the ids counted within the overlap window
+        self.watermark = None
+        self.recent_ids = set()
+
+    def _city(self, location):
+        # "Lahore, Pakistan" and "lahore" are the same city
+        city = str(location or "").split(",")[0].strip().lower()
+        return self.city_index.get(city, self.city_index["other"])
+
+    def update(self, requests, now=None):
+        """Fold new blood request documents into the rolling windows."""
+        now = now or datetime.now(timezone.utc)
+        type_lookup = {blood_type: i for i, blood_type in enumerate(BLOOD_TYPES)}
+        city_idx, type_idx, posted, units = [], [], [], []
+        for request in requests:
+            if request["_id"] in self.recent_ids:
+                continue
+            self.recent_ids.add(request["_id"])
+            created = request["_id"].generation_time
+            if self.watermark is None or created > self.watermark:
+                self.watermark = created
+            if request.get("bloodType") not in type_lookup:
+                continue
+            city_idx.append(self._city(request.get("location")))
+            type_idx.append(type_lookup[request["bloodType"]])
+            latest = min(created, now).replace(tzinfo=None)
+            date_posted = request.get("datePosted")
+            posted.append(min(date_posted, latest) if isinstance(date_posted, datetime) else latest)
+            units.append(request.get("unitsNeeded") or 0)
+
+        # pymongo returns naive UTC datetimes, which datetime64 also treats as UTC
+        seconds = np.array(posted, dtype="datetime64[s]").astype(np.int64)
+        city_idx = np.array(city_idx, dtype=np.intp)
+        type_idx = np.array(type_idx, dtype=np.intp)
+        units = np.array(units, dtype=np.int32)
+        self.hourly.add(city_idx, type_idx, seconds // 3600, units)
+        self.daily.add(city_idx, type_idx, seconds // 86400, units)
+
+        if self.watermark is not None:
+            cutoff = self.watermark - timedelta(seconds=overlap_seconds)
+            self.recent_ids = {i for i in self.recent_ids if i.generation_time >= cutoff}
+        return len(posted)
+
+    def query(self):
+        """Requests created since the watermark, minus the overlap window."""
+        if self.watermark is None:
+            return {}
+        return {"_id": {"$gte": ObjectId.from_datetime(self.watermark - timedelta(seconds=overlap_seconds))}}
+
+    def advance_to(self, now):
+        seconds = int(now.timestamp())
+        self.hourly.advance(seconds // 3600)
+        self.daily.advance(seconds // 86400)
+
+    def summaries(self, now):
+        hourly = self.hourly.series()
+        daily = self.daily.series()
+        # The newest bucket is still filling up, forecast from completed ones only.
+        # Hourly counts are sparse, so a small alpha keeps one request from becoming the level.
+        next_hour = holt_forecast(hourly[..., :-1], horizon=1, alpha=0.05, beta=0.01)
+        next_day = holt_forecast(hourly[..., :-1], horizon=24, alpha=0.05, beta=0.01)
+        next_week = holt_forecast(daily[..., :-1], horizon=7, alpha=0.3, beta=0.1)
+
+        docs = []
+        for c, city in enumerate(self.cities):
+            for t, blood_type in enumerate(BLOOD_TYPES):
+                docs.append({
+                    "city": city,
+                    "bloodType": blood_type,
+                    "unitsThisHour": int(hourly[c, t, -1]),
+                    "unitsLastHour": int(hourly[c, t, -2]),
+                    "unitsLast24Hours": int(hourly[c, t, -24:].sum()),
+                    "unitsLast7Days": int(hourly[c, t].sum()),
+                    "unitsLast30Days": int(daily[c, t, -30:].sum()),
+                    "forecastNextHour": round(float(next_hour[c, t]), 2),
+                    "forecastNext24Hours": round(float(next_day[c, t]), 2),
+                    "forecastNext7Days": round(float(next_week[c, t]), 2),
+                    "updatedAt": now
+                })
+        return docs
+
+    # --- Persistence, so a restart does not rescan the request history ---
+    def to_document(self):
+        return {
+            "_id": STATE_ID,
+            "watermark": self.watermark,
+            "recentIds": list(self.recent_ids),
+            "cities": self.cities,
+            "hourlyHead": self.hourly.head,
+            "dailyHead": self.daily.head,
+            "hourly": Binary(self.hourly.data.tobytes()),
+            "daily": Binary(self.daily.data.tobytes())
+        }
+
+    @classmethod
+    def from_document(cls, doc):
+        aggregates = cls()
+        if not doc:
+            return aggregates
+        # pymongo hands datetimes back naive (UTC)
+        aggregates.watermark = doc["watermark"] and doc["watermark"].replace(tzinfo=timezone.utc)
+        aggregates.recent_ids = set(doc["recentIds"])
+        shape = (len(doc["cities"]), len(BLOOD_TYPES))
+        hourly = np.frombuffer(doc["hourly"], dtype=np.int32).reshape(shape + (HOURLY_SLOTS,))
+        daily = np.frombuffer(doc["daily"], dtype=np.int32).reshape(shape + (DAILY_SLOTS,))
+        # Rows saved under an older city list are folded into the current one
+        rows = np.array([aggregates._city(city) for city in doc["cities"]], dtype=np.intp)
+        np.add.at(aggregates.hourly.data, rows, hourly)
+        np.add.at(aggregates.daily.data, rows, daily)
+        aggregates.hourly.head = doc["hourlyHead"]
+        aggregates.daily.head = doc["dailyHead"]
+        return aggregates
+
+
+def run_pass(db, aggregates):
+    projection = {"location": 1, "bloodType": 1, "unitsNeeded": 1, "datePosted": 1}
+    requests = db["bloodrequests"].find(aggregates.query(), projection)
+
+    now = datetime.now(timezone.utc)
+    processed = aggregates.update(requests, now)
+    aggregates.advance_to(now)
+
+    summaries = aggregates.summaries(now)
+    if summaries:
+        db["blooddemandsummaries"].bulk_write([
+            UpdateOne({"city": doc["city"], "bloodType": doc["bloodType"]}, {"$set": doc}, upsert=True)
+            for doc in summaries
+        ])
+    db["blooddemandstate"].replace_one({"_id": STATE_ID}, aggregates.to_document(), upsert=True)
+    return processed
+
+
+if __name__ == "__main__":
+    client = MongoClient(os.getenv("MONGO_URI"))
+    db = client[db_name]
+    db["blooddemandsummaries"].create_index([("city", 1), ("bloodType", 1)], unique=True)
+    aggregates = DemandAggregates.from_document(db["blooddemandstate"].find_one({"_id": STATE_ID}))
+
+    print("Providing Blood Demand Forecasts to Database...")
+
+    while True:
+        processed = run_pass(db, aggregates)
+        if processed:
+            print(f"Folded {processed} new blood requests into demand aggregates")
+        time.sleep(forecast_interval)
@@ -12,6 +12,10 @@ from sklearn.linear_model import LinearRegression
 # Load .env variables
 load_dotenv()
 
+# Database name and seconds between prediction passes (overridable for benchmarks)
+db_name = os.getenv("MONGO_DB", "test")
+prediction_interval = float(os.getenv("PREDICTION_INTERVAL", "5"))
+
 # Creation of Ideal Data for Wait Time Predictions
 icu_beds = np.random.randint(10, 100, size=100)
 ventilators = np.random.randint(5, 20, size=100)
@@ -43,7 +47,7 @@ while True:
     mongo_uri = os.getenv("MONGO_URI")
     client = MongoClient(mongo_uri)
 
-    db = client["test"]
+    db = client[db_name]
     collection = db["hospitals"]
 
     hospitals = list(collection.find({}))
@@ -60,9 +64,15 @@ while True:
         predicted_wait_emergency = round(max(model_emergency.predict(X_input)[0], 5))  
         predicted_str_emergency = f"{predicted_wait_emergency} mins"
 
-        # Update the wait_times.general and wait_times.emergency field in the Database
+        # Update the wait_times.general and wait_times.emergency field in the Database.
+        # Only write if the resources are still the ones we predicted from, otherwise
+        # a change made during this pass would be overwritten with a stale prediction.
         collection.update_one(
-            {"_id": hospital["_id"]},
+            {
+                "_id": hospital["_id"],
+                "resources.icu_beds": resources.get("icu_beds"),
+                "resources.ventilators": resources.get("ventilators")
+            },
             {"$set": {
                 "wait_times.general": predicted_str_general,
                 "wait_times.emergency": predicted_str_emergency
@@ -70,4 +80,4 @@ while True:
         )
 
 
-    time.sleep(5)
+    time.sleep(prediction_interval)
@@ -0,0 +1,278 @@
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from dataset_cache import BLOOD_TYPES, normalize_frame, read_source
+
+# Column-wise data-quality gate for hospital and blood-request seed files, meant to
+# run before bulk loads. Files are read in chunks, each chunk is checked with
+# vectorized pandas/NumPy operations in a worker process and only the counts and a
+# few sample row numbers come back. Apart from the chunks in flight, memory only grows
+# by 8 bytes per distinct requestId (a 64-bit hash) to find duplicates across chunks.
+#
+#   python data_validator.py blood_requests.csv dummy_hospital_data.json
+#
+# Exits with status 1 if any file has issues.
+
+# Enums from backend/models/bloodRequestModel.js
+URGENCY_LEVELS = ['Normal', 'Urgent', 'Critical']
+
+# Longitude/latitude bounds covering Pakistan, where all seed cities are
+DEFAULT_BOUNDS = {"min_lon": 60.5, "max_lon": 77.5, "min_lat": 23.5, "max_lat": 37.5}
+
+DURATION_COLUMNS = ["wait_time", "wait_times.emergency", "wait_times.general"]
+PHONE_COLUMNS = ["contact_phone", "contact.phone", "contactNumber", "contactInfo.phone"]
+DATE_COLUMNS = ["datePosted", "expiryDate", "last_updated"]
+
+DURATION_PATTERN = r'^\s*(\d+(?:\.\d+)?)\s*(mins?|minutes?|hours?|hrs?)?\s*$'
+# Local (03001234567, 0319-7960571) or international (+92 81 9497 1314) numbers
+PHONE_PATTERN = r'^(?:\+?92|0)\d{9,10}$'
+
+SAMPLE_ROWS = 5
+
+
+# --- Chunk checks ---
+def _flag(issues, name, mask, offset):
+    if isinstance(mask, pd.Series):
+        mask = mask.astype("boolean").fillna(False)
+    mask = np.asarray(mask, dtype=bool)
+    count = int(mask.sum())
+    if count:
+        rows = (np.flatnonzero(mask)[:SAMPLE_ROWS] + offset).tolist()
+        issues[name] = {"count": count, "rows": rows}
+
+
+def _check_coordinates(df, issues, offset, bounds):
+    lon = pd.to_numeric(df["longitude"], errors="coerce").to_numpy(dtype=np.float64)
+    lat = pd.to_numeric(df["latitude"], errors="coerce").to_numpy(dtype=np.float64)
+
+    missing = np.isnan(lon) | np.isnan(lat)
+    invalid = ~missing & ((np.abs(lat) > 90) | (np.abs(lon) > 180))
+
+    def inside(x, y):
+        return (
+            (x >= bounds["min_lon"]) & (x <= bounds["max_lon"]) &
+            (y >= bounds["min_lat"]) & (y <= bounds["max_lat"])
+        )
+
+    in_region = inside(lon, lat)
+    # (lat, lon) written where [lon, lat] was expected, as blood_req.py vs hello.py do
+    swapped = ~missing & ~in_region & inside(lat, lon)
+    outside = ~missing & ~invalid & ~in_region & ~swapped
+
+    _flag(issues, "coordinates_missing", missing, offset)
+    _flag(issues, "coordinates_out_of_range", invalid & ~swapped, offset)
+    _flag(issues, "coordinates_swapped", swapped, offset)
+    _flag(issues, "coordinates_outside_region", outside, offset)
+
+
+def _check_enum(df, column, allowed, issues, offset):
+    values = df[column]
+    _flag(issues, f"{column}_missing", values.isna(), offset)
+    _flag(issues, f"{column}_invalid", values.notna() & ~values.isin(allowed), offset)
+
+
+def _check_duration(df, column, issues, offset):
+    values = df[column]
+    numeric = pd.to_numeric(values, errors="coerce")
+    text = values.astype(object).where(numeric.isna() & values.notna(), None).astype("string")
+    parsed = text.str.extract(DURATION_PATTERN, expand=True)[0]
+    known = text.str.strip().str.lower().eq("unknown").fillna(False)
+
+    amount = numeric.fillna(pd.to_numeric(parsed, errors="coerce").astype(np.float64))
+    unparseable = values.notna() & amount.isna() & ~known
+    _flag(issues, f"{column}_unparseable", unparseable, offset)
+    _flag(issues, f"{column}_negative", amount < 0, offset)
+
+
+def _check_phone(df, column, issues, offset):
+    values = df[column].astype("string")
+    digits = values.str.replace(r'[\s\-()]', '', regex=True)
+    valid = digits.str.fullmatch(PHONE_PATTERN).fillna(False)
+    _flag(issues, f"{column}_invalid", values.notna() & ~valid, offset)
+
+
+def validate_chunk(df, offset, bounds, urgency_levels):
+    """
+    Check one chunk. Returns issue counts/sample rows plus hashes of the requestIds
+    seen, so duplicates can be found across chunks by the caller.
+    """
+    issues = {}
+
+    if "longitude" in df.columns and "latitude" in df.columns:
+        _check_coordinates(df, issues, offset, bounds)
+    if "bloodType" in df.columns:
+        _check_enum(df, "bloodType", BLOOD_TYPES, issues, offset)
+    if "urgencyLevel" in df.columns:
+        _check_enum(df, "urgencyLevel", urgency_levels, issues, offset)
+    if "unitsNeeded" in df.columns:
+        units = pd.to_numeric(df["unitsNeeded"], errors="coerce")
+        _flag(issues, "unitsNeeded_invalid", units.isna() | (units < 1) | (units % 1 != 0), offset)
+
+    for column in DURATION_COLUMNS:
+        if column in df.columns:
+            _check_duration(df, column, issues, offset)
+    for column in PHONE_COLUMNS:
+        if column in df.columns:
+            _check_phone(df, column, issues, offset)
+    for column in DATE_COLUMNS:
+        if column in df.columns:
+            parsed = pd.to_datetime(df[column], utc=True, errors="coerce", format="mixed")
+            _flag(issues, f"{column}_unparseable", df[column].notna() & parsed.isna(), offset)
+
+    id_hashes = None
+    if "requestId" in df.columns:
+        present = df["requestId"].notna()
+        _flag(issues, "requestId_missing", ~present, offset)
+        ids = df["requestId"][present].astype(str).to_numpy(dtype=object)
+        id_hashes = (pd.util.hash_array(ids), np.flatnonzero(present.to_numpy()) + offset)
+
+    return {"rows": len(df), "issues": issues, "id_hashes": id_hashes}
+
+
+class _DuplicateTracker:
+    """
+    requestIds seen so far, as a sorted array of 64-bit hashes. Chunks must be fed in
+    file order; a row is a duplicate if its id already appeared in an earlier row.
+    """
+
+    def __init__(self):
+        self.seen = np.empty(0, dtype=np.uint64)
+        self.count = 0
+        self.rows = []
+
+    def add(self, hashes, rows):
+        repeated = pd.Series(hashes).duplicated().to_numpy().copy()
+        if len(self.seen):
+            positions = np.minimum(np.searchsorted(self.seen, hashes), len(self.seen) - 1)
+            repeated |= self.seen[positions] == hashes
+        self.count += int(repeated.sum())
+        self.rows = (self.rows + rows[repeated][:SAMPLE_ROWS].tolist())[:SAMPLE_ROWS]
+        # Both parts are sorted, so the stable sort is a linear merge
+        self.seen = np.sort(np.concatenate((self.seen, np.unique(hashes[~repeated]))), kind="stable")
+
+
+# --- Streaming sources ---
+def iter_chunks(path, chunk_size):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        for chunk in pd.read_csv(path, encoding="utf-8-sig", chunksize=chunk_size):
+            yield chunk
+    elif extension in (".json", ".jsonl") and not _is_json_array(path):
+        lines = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    lines.append(json.loads(line))
+                if len(lines) == chunk_size:
+                    yield normalize_frame(pd.json_normalize(lines))
+                    lines = []
+        if lines:
+            yield normalize_frame(pd.json_normalize(lines))
+    else:
+        # XLSX and JSON arrays cannot be streamed. Parse the raw values rather than the
+        # snapshot cache, which has already coerced bad dates and categories away.
+        df = read_source(path)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size].reset_index(drop=True)
+
+
+def _is_json_array(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                return line.lstrip().startswith("[")
+    return False
+
+
+def _merge(report, result):
+    report["rows"] += result["rows"]
+    for name, issue in result["issues"].items():
+        merged = report["issues"].setdefault(name, {"count": 0, "rows": []})
+        merged["count"] += issue["count"]
+        merged["rows"] = sorted(merged["rows"] + issue["rows"])[:SAMPLE_ROWS]
+
+
+def validate_file(path, chunk_size=100000, workers=None, bounds=DEFAULT_BOUNDS, urgency_levels=URGENCY_LEVELS):
+    """
+    Validate a whole file and return a compact report:
+    {"file", "rows", "issues": {name: {"count", "rows": [first sample row numbers]}}}
+    """
+    report = {"file": path, "rows": 0, "issues": {}}
+    duplicates = _DuplicateTracker()
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = []
+        offset = 0
+
+        def collect(future):
+            result = future.result()
+            _merge(report, result)
+            if result["id_hashes"] is not None:
+                duplicates.add(*result["id_hashes"])
+
+        for chunk in iter_chunks(path, chunk_size):
+            in_flight.append(pool.submit(validate_chunk, chunk, offset, bounds, urgency_levels))
+            offset += len(chunk)
+            # Bound the number of chunks held in memory at once. Results are collected
+            # in submission order, which the duplicate check relies on.
+            if len(in_flight) >= workers * 2:
+                collect(in_flight.pop(0))
+        for future in in_flight:
+            collect(future)
+
+    if duplicates.count:
+        report["issues"]["requestId_duplicate"] = {"count": duplicates.count, "rows": duplicates.rows}
+
+    report["issues"] = dict(sorted(report["issues"].items()))
+    return report
+
+
+def print_report(report):
+    if not report["issues"]:
+        print(f"✅ {report['file']}: {report['rows']} rows, no issues")
+        return
+    total = sum(issue["count"] for issue in report["issues"].values())
+    print(f"❌ {report['file']}: {report['rows']} rows, {total} issues")
+    for name, issue in report["issues"].items():
+        print(f"   {name:<32} {issue['count']:>10}  e.g. rows {issue['rows']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate hospital / blood request seed files before bulk loads")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--urgency-levels", default=",".join(URGENCY_LEVELS),
+                        help="comma separated allowed urgencyLevel values")
+    parser.add_argument("--bounds", default=None,
+                        help="min_lon,min_lat,max_lon,max_lat of the expected region")
+    parser.add_argument("--json", action="store_true", help="print the reports as JSON")
+    args = parser.parse_args()
+
+    bounds = DEFAULT_BOUNDS
+    if args.bounds:
+        min_lon, min_lat, max_lon, max_lat = map(float, args.bounds.split(","))
+        bounds = {"min_lon": min_lon, "max_lon": max_lon, "min_lat": min_lat, "max_lat": max_lat}
+
+    reports = [
+        validate_file(path, args.chunk_size, args.workers, bounds, args.urgency_levels.split(","))
+        for path in args.files
+    ]
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        for report in reports:
+            print_report(report)
+
+    sys.exit(1 if any(report["issues"] for report in reports) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Converts the seed files (dummy_hospital_data.*, blood_requests.*, blood_req.json)
+# into memory-mapped NumPy snapshots the first time they are read. Later loads only
+# stat the source and mmap the cached columns, so scripts start in milliseconds
+# instead of re-parsing XLSX/CSV/JSON every run.
+#
+#   from dataset_cache import load
+#   requests = load("blood_requests.xlsx")
+#   coords = requests.coordinates          # float64 (n, 2), [longitude, latitude]
+#   codes = requests.codes("bloodType")    # int16 codes into BLOOD_TYPES
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".dataset_cache")
+# Bump when the snapshot layout or column encoding changes; older snapshots are rebuilt
+FORMAT_VERSION = 1
+
+# Fixed category order so blood type codes mean the same thing in every snapshot
+BLOOD_TYPES = ['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-']
+
+# Low cardinality string columns stored as integer codes (None = categories taken from the data)
+CATEGORICAL_COLUMNS = {
+    "bloodType": BLOOD_TYPES,
+    "urgencyLevel": None,
+    "location": None,
+    "city": None,
+    "location.type": None,
+}
+
+DATE_COLUMNS = {"datePosted", "expiryDate", "last_updated"}
+
+
+# --- Reading and normalizing sources ---
+def read_source(path):
+    """
+    Parse a seed file into a flat DataFrame (no caching).
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".xlsx", ".xls"):
+        return normalize_frame(pd.read_excel(path))
+    if extension == ".csv":
+        return normalize_frame(pd.read_csv(path, encoding="utf-8-sig"))
+    if extension in (".json", ".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            text = f.read().strip()
+        if text.startswith("["):
+            records = json.loads(text)
+        else:
+            records = [json.loads(line) for line in text.splitlines() if line.strip()]
+        return normalize_frame(pd.json_normalize(records))
+    raise ValueError(f"Unsupported seed file type: {path}")
+
+
+def normalize_frame(df):
+    """
+    Flatten list columns: GeoJSON coordinates become longitude/latitude columns and
+    any other list becomes a comma separated string (the format the CSV files use).
+    """
+    df = df.copy()
+    if "location.coordinates" in df.columns:
+        coords = df.pop("location.coordinates")
+        lon_lat = np.array([c if isinstance(c, list) and len(c) == 2 else [np.nan, np.nan] for c in coords], dtype=np.float64)
+        df["longitude"] = lon_lat[:, 0] if len(lon_lat) else np.empty(0)
+        df["latitude"] = lon_lat[:, 1] if len(lon_lat) else np.empty(0)
+    for column in df.columns:
+        if df[column].dtype == object and df[column].map(lambda v: isinstance(v, list)).any():
+            df[column] = df[column].map(lambda v: ", ".join(map(str, v)) if isinstance(v, list) else v)
+    return df
+
+
+# --- Column encoding ---
+def _encode_column(name, series):
+    """
+    Returns (array, column metadata) for one DataFrame column.
+    """
+    if name in CATEGORICAL_COLUMNS:
+        values = series.astype(object).where(series.notna(), None)
+        categories = CATEGORICAL_COLUMNS[name] or sorted({str(v) for v in values if v is not None})
+        lookup = {category: code for code, category in enumerate(categories)}
+        codes = np.array([lookup.get(str(v), -1) if v is not None else -1 for v in values], dtype=np.int16)
+        return codes, {"kind": "categorical", "categories": list(categories)}
+
+    if name in DATE_COLUMNS:
+        parsed = pd.to_datetime(series, utc=True, errors="coerce", format="mixed")
+        return parsed.dt.tz_localize(None).to_numpy(dtype="datetime64[s]"), {"kind": "datetime"}
+
+    if pd.api.types.is_bool_dtype(series):
+        return series.to_numpy(dtype=np.bool_), {"kind": "bool"}
+    if pd.api.types.is_integer_dtype(series):
+        return series.to_numpy(dtype=np.int64), {"kind": "int"}
+    if pd.api.types.is_float_dtype(series):
+        return series.to_numpy(dtype=np.float64), {"kind": "float"}
+
+    strings = series.astype(object).where(series.notna(), "").map(str)
+    return np.array(strings.tolist() or [""], dtype=np.str_)[:len(strings)], {"kind": "string"}
+
+
+def _write_snapshot(df, directory, source_meta):
+    tmp_directory = f"{directory}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_directory, ignore_errors=True)
+    os.makedirs(tmp_directory)
+
+    columns = {}
+    if "longitude" in df.columns and "latitude" in df.columns:
+        coordinates = np.column_stack((
+            df.pop("longitude").to_numpy(dtype=np.float64),
+            df.pop("latitude").to_numpy(dtype=np.float64)
+        ))
+        np.save(os.path.join(tmp_directory, "coordinates.npy"), coordinates)
+        columns["coordinates"] = {"kind": "coordinates", "file": "coordinates.npy"}
+
+    for index, name in enumerate(df.columns):
+        array, column_meta = _encode_column(name, df[name])
+        filename = f"col{index}.npy"
+        np.save(os.path.join(tmp_directory, filename), array)
+        column_meta["file"] = filename
+        columns[name] = column_meta
+
+    meta = dict(source_meta, version=FORMAT_VERSION, rows=len(df), columns=columns)
+    with open(os.path.join(tmp_directory, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+    # Another process may have built the same snapshot meanwhile; either copy is fine
+    try:
+        os.rename(tmp_directory, directory)
+    except OSError:
+        shutil.rmtree(tmp_directory, ignore_errors=True)
+
+
+# --- Snapshot access ---
+class Snapshot:
+    """
+    Read-only view of a cached seed file. Columns are loaded lazily as memory maps.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self._arrays = {}
+
+    def __len__(self):
+        return self.meta["rows"]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    @property
+    def columns(self):
+        names = [name for name in self.meta["columns"] if name != "coordinates"]
+        if "coordinates" in self.meta["columns"]:
+            names += ["longitude", "latitude"]
+        return names
+
+    def _array(self, name):
+        if name not in self._arrays:
+            column = self.meta["columns"][name]
+            self._arrays[name] = np.load(os.path.join(self.directory, column["file"]), mmap_mode="r")
+        return self._arrays[name]
+
+    def __getitem__(self, name):
+        if name == "longitude":
+            return self.coordinates[:, 0]
+        if name == "latitude":
+            return self.coordinates[:, 1]
+        if name not in self.meta["columns"]:
+            raise KeyError(name)
+        return self._array(name)
+
+    @property
+    def coordinates(self):
+        """float64 array of shape (n, 2) holding [longitude, latitude] like GeoJSON."""
+        if "coordinates" not in self.meta["columns"]:
+            raise KeyError("coordinates")
+        return self._array("coordinates")
+
+    def categories(self, name):
+        return self.meta["columns"][name]["categories"]
+
+    def codes(self, name):
+        """int16 category codes; -1 marks a missing or unknown value."""
+        if self.meta["columns"][name]["kind"] != "categorical":
+            raise TypeError(f"{name} is not a categorical column")
+        return self._array(name)
+
+    def decode(self, name):
+        categories = np.array(self.categories(name) + [""], dtype=object)
+        return categories[self.codes(name)]
+
+    def to_frame(self):
+        data = {}
+        for name in self.columns:
+            kind = self.meta["columns"].get(name, {}).get("kind")
+            data[name] = self.decode(name) if kind == "categorical" else np.asarray(self[name])
+        return pd.DataFrame(data)
+
+
+# --- Cache lookup ---
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _pointer_path(path, cache_dir):
+    path_key = hashlib.sha1(path.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(cache_dir, f"{os.path.basename(path)}-{path_key}.json")
+
+
+def load(path, cache_dir=CACHE_DIR, refresh=False):
+    """
+    Return a Snapshot of `path`, building it if the source changed since the last load.
+
+    A cheap stat (mtime + size) decides whether the cached snapshot is still valid.
+    Only if it changed is the file hashed; identical content reuses the old snapshot.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    pointer_path = _pointer_path(path, cache_dir)
+
+    pointer = None
+    if not refresh and os.path.exists(pointer_path):
+        with open(pointer_path, encoding="utf-8") as f:
+            pointer = json.load(f)
+        directory = os.path.join(cache_dir, pointer["snapshot"])
+        if (pointer.get("version") == FORMAT_VERSION and pointer["mtime_ns"] == stat.st_mtime_ns
+                and pointer["size"] == stat.st_size and os.path.isdir(directory)):
+            return Snapshot(directory)
+
+    sha256 = _file_hash(path)
+    snapshot_name = f"{os.path.basename(path)}-{sha256[:16]}-v{FORMAT_VERSION}"
+    directory = os.path.join(cache_dir, snapshot_name)
+    if refresh:
+        shutil.rmtree(directory, ignore_errors=True)
+    if not os.path.isdir(directory):
+        source_meta = {"source": path, "sha256": sha256, "mtime_ns": stat.st_mtime_ns}
+        _write_snapshot(read_source(path), directory, source_meta)
+
+    # Drop the snapshot this source pointed at before, unless it is the same content
+    if pointer and pointer["snapshot"] != snapshot_name:
+        shutil.rmtree(os.path.join(cache_dir, pointer["snapshot"]), ignore_errors=True)
+
+    with open(pointer_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "source": path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+            "snapshot": snapshot_name, "version": FORMAT_VERSION
+        }, f)
+    return Snapshot(directory)
+
+
+if __name__ == "__main__":
+    # Warm the cache: python dataset_cache.py blood_requests.xlsx dummy_hospital_data.json ...
+    for source in sys.argv[1:]:
+        started = time.perf_counter()
+        snapshot = load(source)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"✅ {source}: {len(snapshot)} rows, {len(snapshot.columns)} columns ({elapsed_ms:.1f} ms)")
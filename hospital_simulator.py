@@ -0,0 +1,436 @@
+import argparse
+import heapq
+import json
+import os
+import random
+import string
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+# Discrete-event simulator for hospital load. Models ICU bed / ventilator occupancy
+# (admissions and discharges) per hospital and blood request arrivals across the
+# seed cities, and writes everything to a replayable JSON lines event log:
+#
+#   python hospital_simulator.py simulate --hospitals 100000 --days 3 --out sim_log.jsonl
+#   python hospital_simulator.py replay sim_log.jsonl --mongo-uri mongodb://localhost:27017 --db emcon_sim
+#   python hospital_simulator.py replay sim_log.jsonl --out-dir sim_output
+#
+# Hospitals start near steady-state ICU and ventilator occupancy, with steady-state
+# remaining stays for the patients already admitted. ICU occupancy is flat from the
+# start; ventilator occupancy is an approximation and settles within about 1% over the
+# first days.
+#
+# Log lines: one "header", one "hospital" per hospital (initial state), then events
+# ordered by "t" (seconds since the start):
+#   admit / discharge / diverted -> {"t", "e", "h", "icu", "vent"} (available beds after the event)
+#   blood_request                -> {"t", "e", "h", "requestId", "bloodType", "urgencyLevel", "unitsNeeded"}
+
+# Approximate coordinates for each city [longitude, latitude]
+city_coordinates = {
+    'Lahore': [74.3295, 31.5470],
+    'Karachi': [67.0011, 24.8607],
+    'Islamabad': [73.0479, 33.6844],
+    'Rawalpindi': [73.0551, 33.6007],
+    'Peshawar': [71.5249, 34.0150],
+    'Multan': [71.4734, 30.1575],
+    'Faisalabad': [73.0831, 31.4504],
+    'Hyderabad': [68.3738, 25.3920],
+    'Quetta': [66.9827, 30.1798],
+    'Sialkot': [74.5207, 32.4945],
+    'Gujranwala': [74.1910, 32.1877],
+    'Mardan': [72.0485, 34.1931],
+    'Sukkur': [69.0369, 27.7054],
+    'Bahawalpur': [71.6683, 29.3950],
+    'Larkana': [68.2131, 27.5576]
+}
+
+# Rough share of hospitals per city, larger cities get more
+city_weights = {
+    'Lahore': 11, 'Karachi': 15, 'Islamabad': 3, 'Rawalpindi': 3, 'Peshawar': 4,
+    'Multan': 3, 'Faisalabad': 5, 'Hyderabad': 3, 'Quetta': 2, 'Sialkot': 1,
+    'Gujranwala': 2, 'Mardan': 1, 'Sukkur': 1, 'Bahawalpur': 1, 'Larkana': 1
+}
+
+# Enums from backend/models/bloodRequestModel.js, weighted by how often they occur
+blood_types = ['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-']
+blood_type_weights = [0.22, 0.02, 0.30, 0.02, 0.07, 0.01, 0.32, 0.04]
+urgency_levels = ['Normal', 'Urgent', 'Critical']
+urgency_weights = [0.6, 0.3, 0.1]
+
+hospital_adjectives = ['General', 'Central', 'Regional', 'National', 'City']
+hospital_types = ['Hospital', 'Medical Center', 'Clinic']
+
+# Event kinds, in the order ties at the same time are processed
+DISCHARGE, DISCHARGE_VENT, ADMIT, BLOOD_REQUEST = range(4)
+
+
+class _Draws:
+    """Hands out random numbers one at a time from pre-drawn NumPy batches."""
+
+    def __init__(self, draw, batch=1 << 16):
+        self.draw = draw
+        self.batch = batch
+        self.values = []
+        self.index = 0
+
+    def next(self):
+        if self.index == len(self.values):
+            self.values = self.draw(self.batch).tolist()
+            self.index = 0
+        value = self.values[self.index]
+        self.index += 1
+        return value
+
+
+def _truncated_poisson(rng, mean, cap):
+    """Poisson draws with the given means, redrawn until they are at most `cap`."""
+    values = rng.poisson(mean)
+    over = values > cap
+    while over.any():
+        values[over] = rng.poisson(mean[over])
+        over = values > cap
+    return values
+
+
+def _erlang_b(load, servers):
+    """Share of arrivals turned away by a loss system with `servers` slots and offered `load`."""
+    blocked = np.ones_like(load, dtype=np.float64)
+    for k in range(1, int(servers.max()) + 1):
+        step = load * blocked / (k + load * blocked)
+        blocked = np.where(k <= servers, step, blocked)
+    return blocked
+
+
+def build_hospitals(count, rng):
+    cities = list(city_coordinates)
+    weights = np.array([city_weights[city] for city in cities], dtype=np.float64)
+    city_idx = rng.choice(len(cities), size=count, p=weights / weights.sum())
+    jitter = rng.uniform(-0.05, 0.05, size=(count, 2))
+    coordinates = np.array([city_coordinates[city] for city in cities])[city_idx] + jitter
+
+    return {
+        "city": [cities[i] for i in city_idx],
+        "coordinates": np.round(coordinates, 6),
+        "icu_capacity": rng.integers(10, 51, size=count),
+        "vent_capacity": rng.integers(5, 21, size=count),
+        "adjective": rng.integers(0, len(hospital_adjectives), size=count),
+        "type": rng.integers(0, len(hospital_types), size=count),
+    }
+
+
+def simulate(out_path, hospitals=1000, days=1.0, seed=42, occupancy=0.75, mean_stay_hours=72.0,
+             ventilator_share=0.4, blood_requests_per_hospital_day=0.5, start=None):
+    """
+    Run the simulation and write the event log to `out_path`. Returns the number of events.
+    """
+    rng = np.random.default_rng(seed)
+    rand = random.Random(seed)
+    start = start or datetime(2025, 4, 1, tzinfo=timezone.utc)
+    horizon = days * 86400.0
+    mean_stay = mean_stay_hours * 3600.0
+
+    state = build_hospitals(hospitals, rng)
+    icu_capacity = state["icu_capacity"]
+    vent_capacity = state["vent_capacity"]
+
+    # Start at steady state. Both the ICU and the ventilators are loss systems (full ICUs
+    # divert arrivals, patients who find no free ventilator go without), whose occupancy
+    # is a Poisson number with mean equal to the offered load, truncated at capacity.
+    # Ventilators are offered a share of the admissions the ICU actually accepts; treating
+    # that stream as independent of ICU occupancy slightly underestimates ventilator use.
+    offered = occupancy * icu_capacity
+    icu_used = _truncated_poisson(rng, offered, icu_capacity)
+    offered_vent = ventilator_share * offered * (1 - _erlang_b(offered, icu_capacity))
+    vent_used = _truncated_poisson(rng, offered_vent, np.minimum(vent_capacity, icu_used))
+
+    # Arrival rate that keeps occupancy around the target (Little's law)
+    admit_gap = mean_stay / (occupancy * icu_capacity)
+
+    exponential = _Draws(rng.standard_exponential)
+    sigma = 0.5
+    mu = np.log(mean_stay) - sigma ** 2 / 2
+    stay = _Draws(lambda n: rng.lognormal(mu, sigma, n))
+    uniform = _Draws(rng.random)
+
+    # Patients already in a bed at the start are part-way through their stay. In steady
+    # state longer stays are over-represented in proportion to their length (for a
+    # lognormal that shifts mu by sigma^2) and the time left is uniform within the stay.
+    # Drawing them like new admissions would empty beds in a burst over the first days.
+    remaining_stay = _Draws(lambda n: rng.random(n) * rng.lognormal(mu + sigma ** 2, sigma, n))
+
+    events = []
+    for h in range(hospitals):
+        for _ in range(int(vent_used[h])):
+            events.append((remaining_stay.next(), DISCHARGE_VENT, h))
+        for _ in range(int(icu_used[h] - vent_used[h])):
+            events.append((remaining_stay.next(), DISCHARGE, h))
+        events.append((exponential.next() * admit_gap[h], ADMIT, h))
+    if blood_requests_per_hospital_day > 0 and hospitals > 0:
+        blood_gap = 86400.0 / (blood_requests_per_hospital_day * hospitals)
+        events.append((exponential.next() * blood_gap, BLOOD_REQUEST, -1))
+    heapq.heapify(events)
+
+    icu_used = icu_used.tolist()
+    vent_used = vent_used.tolist()
+    icu_cap = icu_capacity.tolist()
+    vent_cap = vent_capacity.tolist()
+    admit_gap = admit_gap.tolist()
+    alphabet = string.ascii_lowercase + string.digits
+
+    written = 0
+    with open(out_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        header = {
+            "type": "header", "start": start.isoformat(), "days": days, "seed": seed,
+            "hospitals": hospitals, "occupancy": occupancy, "mean_stay_hours": mean_stay_hours,
+            "ventilator_share": ventilator_share, "blood_requests_per_hospital_day": blood_requests_per_hospital_day,
+            "initial_stays": "steady_state"
+        }
+        f.write(json.dumps(header) + "\n")
+        for h in range(hospitals):
+            city = state["city"][h]
+            f.write(json.dumps({
+                "type": "hospital", "h": h,
+                "name": f"{city} {hospital_adjectives[state['adjective'][h]]} {hospital_types[state['type'][h]]} {h}",
+                "city": city,
+                "coordinates": state["coordinates"][h].tolist(),
+                "icu_beds": icu_cap[h] - icu_used[h],
+                "ventilators": vent_cap[h] - vent_used[h],
+            }) + "\n")
+
+        pop = heapq.heappop
+        push = heapq.heappush
+        while events:
+            t, kind, h = pop(events)
+            if t >= horizon:
+                break
+            ts = round(t, 1)
+
+            if kind == ADMIT:
+                push(events, (t + exponential.next() * admit_gap[h], ADMIT, h))
+                if icu_used[h] >= icu_cap[h]:
+                    f.write(f'{{"t":{ts},"e":"diverted","h":{h},"icu":0,"vent":{vent_cap[h] - vent_used[h]}}}\n')
+                else:
+                    icu_used[h] += 1
+                    # Patients who need a ventilator but find none still take the ICU bed
+                    if uniform.next() < ventilator_share and vent_used[h] < vent_cap[h]:
+                        vent_used[h] += 1
+                        push(events, (t + stay.next(), DISCHARGE_VENT, h))
+                    else:
+                        push(events, (t + stay.next(), DISCHARGE, h))
+                    f.write(f'{{"t":{ts},"e":"admit","h":{h},"icu":{icu_cap[h] - icu_used[h]},"vent":{vent_cap[h] - vent_used[h]}}}\n')
+
+            elif kind == BLOOD_REQUEST:
+                push(events, (t + exponential.next() * blood_gap, BLOOD_REQUEST, -1))
+                h = int(uniform.next() * hospitals)
+                request_id = "".join(rand.choices(alphabet, k=8))
+                blood_type = rand.choices(blood_types, blood_type_weights)[0]
+                urgency = rand.choices(urgency_levels, urgency_weights)[0]
+                f.write(
+                    f'{{"t":{ts},"e":"blood_request","h":{h},"requestId":"{request_id}",'
+                    f'"bloodType":"{blood_type}","urgencyLevel":"{urgency}","unitsNeeded":{rand.randint(1, 6)}}}\n'
+                )
+
+            else:
+                icu_used[h] -= 1
+                if kind == DISCHARGE_VENT:
+                    vent_used[h] -= 1
+                f.write(f'{{"t":{ts},"e":"discharge","h":{h},"icu":{icu_cap[h] - icu_used[h]},"vent":{vent_cap[h] - vent_used[h]}}}\n')
+            written += 1
+
+    return written
+
+
+# --- Replay ---
+class FileSink:
+    """
+    Writes Mongo-shaped documents: hospitals.json (JSON lines, like hello.py),
+    blood_requests.json and resource_updates.json (one line per hospital per flush).
+    """
+
+    def __init__(self, out_dir):
+        os.makedirs(out_dir, exist_ok=True)
+        self.hospitals = open(os.path.join(out_dir, "hospitals.json"), "w", encoding="utf-8")
+        self.requests = open(os.path.join(out_dir, "blood_requests.json"), "w", encoding="utf-8")
+        self.updates = open(os.path.join(out_dir, "resource_updates.json"), "w", encoding="utf-8")
+
+    def add_hospitals(self, docs):
+        for h, doc in docs:
+            self.hospitals.write(json.dumps(dict(doc, h=h), default=str) + "\n")
+
+    def apply(self, now, resources, requests):
+        for h, (icu, vent) in resources.items():
+            self.updates.write(json.dumps({"h": h, "icu_beds": icu, "ventilators": vent, "last_updated": now.isoformat()}) + "\n")
+        for h, doc in requests:
+            doc = dict(doc, h=h, datePosted=doc["datePosted"].isoformat(), expiryDate=doc["expiryDate"].isoformat())
+            self.requests.write(json.dumps(doc) + "\n")
+
+    def close(self):
+        for f in (self.hospitals, self.requests, self.updates):
+            f.close()
+
+
+class MongoSink:
+    """Loads hospitals, applies coalesced resource updates and inserts blood requests."""
+
+    def __init__(self, mongo_uri, db_name):
+        from pymongo import MongoClient
+        self.client = MongoClient(mongo_uri)
+        self.db = self.client[db_name]
+        self.ids = {}
+
+    def add_hospitals(self, docs):
+        result = self.db["hospitals"].insert_many([doc for _, doc in docs])
+        for (h, _), inserted_id in zip(docs, result.inserted_ids):
+            self.ids[h] = inserted_id
+
+    def apply(self, now, resources, requests):
+        from pymongo import UpdateOne
+        if resources:
+            self.db["hospitals"].bulk_write([
+                UpdateOne({"_id": self.ids[h]}, {"$set": {
+                    "resources.icu_beds": icu,
+                    "resources.ventilators": vent,
+                    "last_updated": now
+                }})
+                for h, (icu, vent) in resources.items()
+            ], ordered=False)
+        if requests:
+            self.db["bloodrequests"].insert_many([dict(doc, hospitalId=self.ids[h]) for h, doc in requests], ordered=False)
+
+    def close(self):
+        self.client.close()
+
+
+def _hospital_doc(line):
+    return {
+        "name": line["name"],
+        "location": {
+            "type": "Point",
+            "coordinates": line["coordinates"],
+            "address": f"{line['city']}, Pakistan"
+        },
+        "cityu": line["city"],
+        "resources": {"icu_beds": line["icu_beds"], "ventilators": line["ventilators"]},
+        "contact": {"phone": "+92 00 0000 0000"},
+        "wait_times": {"emergency": "Unknown", "general": "Unknown"}
+    }
+
+
+def replay(log_path, sink, flush_seconds=60.0, speed=0.0, batch=5000):
+    """
+    Feed an event log into `sink`. Resource changes are coalesced per hospital and
+    flushed every `flush_seconds` of simulated time. `speed` is simulated seconds per
+    wall-clock second (0 replays as fast as possible).
+    """
+    hospital_info = {}
+    hospital_docs = []
+    resources = {}
+    requests = []
+    next_flush = flush_seconds
+    wall_start = time.monotonic()
+    start = None
+
+    def flush(t):
+        if speed:
+            delay = t / speed - (time.monotonic() - wall_start)
+            if delay > 0:
+                time.sleep(delay)
+        sink.apply(start + timedelta(seconds=t), resources, requests)
+        resources.clear()
+        requests.clear()
+
+    with open(log_path, encoding="utf-8") as f:
+        for raw in f:
+            line = json.loads(raw)
+            kind = line.get("e") or line["type"]
+
+            if kind == "header":
+                start = datetime.fromisoformat(line["start"])
+            elif kind == "hospital":
+                hospital_info[line["h"]] = (line["name"], line["city"])
+                hospital_docs.append((line["h"], _hospital_doc(line)))
+                if len(hospital_docs) == batch:
+                    sink.add_hospitals(hospital_docs)
+                    hospital_docs = []
+            else:
+                if hospital_docs:
+                    sink.add_hospitals(hospital_docs)
+                    hospital_docs = []
+                while line["t"] >= next_flush:
+                    flush(next_flush)
+                    next_flush += flush_seconds
+
+                if kind == "blood_request":
+                    posted = start + timedelta(seconds=line["t"])
+                    name, city = hospital_info[line["h"]]
+                    requests.append((line["h"], {
+                        "requestId": line["requestId"],
+                        "hospitalName": name,
+                        "bloodType": line["bloodType"],
+                        "urgencyLevel": line["urgencyLevel"],
+                        "unitsNeeded": line["unitsNeeded"],
+                        "location": city,
+                        "datePosted": posted,
+                        "expiryDate": posted + timedelta(days=2),
+                        "accepted": False
+                    }))
+                else:
+                    resources[line["h"]] = (line["icu"], line["vent"])
+
+    if hospital_docs:
+        sink.add_hospitals(hospital_docs)
+    flush(next_flush)
+    sink.close()
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Discrete-event hospital load simulator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sim = commands.add_parser("simulate", help="run a simulation and write the event log")
+    sim.add_argument("--hospitals", type=_positive_int, default=1000)
+    sim.add_argument("--days", type=float, default=1.0)
+    sim.add_argument("--seed", type=int, default=42)
+    sim.add_argument("--occupancy", type=float, default=0.75, help="target ICU occupancy")
+    sim.add_argument("--mean-stay-hours", type=float, default=72.0)
+    sim.add_argument("--ventilator-share", type=float, default=0.4, help="share of ICU patients needing a ventilator")
+    sim.add_argument("--blood-requests-per-hospital-day", type=float, default=0.5)
+    sim.add_argument("--out", default="sim_log.jsonl")
+
+    rep = commands.add_parser("replay", help="feed an event log into Mongo or files")
+    rep.add_argument("log")
+    rep.add_argument("--mongo-uri")
+    rep.add_argument("--db", default="emcon_sim")
+    rep.add_argument("--out-dir")
+    rep.add_argument("--flush-seconds", type=float, default=60.0, help="simulated seconds between writes")
+    rep.add_argument("--speed", type=float, default=0.0, help="simulated seconds per wall second, 0 = as fast as possible")
+
+    args = parser.parse_args()
+    started = time.perf_counter()
+
+    if args.command == "simulate":
+        count = simulate(
+            args.out, args.hospitals, args.days, args.seed, args.occupancy, args.mean_stay_hours,
+            args.ventilator_share, args.blood_requests_per_hospital_day
+        )
+        print(f"✅ Simulated {args.days} days for {args.hospitals} hospitals: {count} events written to '{args.out}' "
+              f"in {time.perf_counter() - started:.1f}s")
+    else:
+        if bool(args.mongo_uri) == bool(args.out_dir):
+            parser.error("replay needs exactly one of --mongo-uri or --out-dir")
+        sink = MongoSink(args.mongo_uri, args.db) if args.mongo_uri else FileSink(args.out_dir)
+        replay(args.log, sink, args.flush_seconds, args.speed)
+        print(f"✅ Replayed '{args.log}' in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from bson import ObjectId
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+from BloodDemandForecaster import CITIES, DemandAggregates, RingBuffer
+
+now = datetime(2025, 4, 10, 12, 30, tzinfo=timezone.utc)
+failures = []
+
+
+def check(name, condition, detail=""):
+    if condition:
+        print(f"✅ {name}")
+    else:
+        print(f"❌ {name} - Test Failed {detail}")
+        failures.append(name)
+
+
+def blood_request(created, units, location="Lahore", blood_type="A+", date_posted=None):
+    # ObjectId with the given creation time and a unique tail, like one made by the backend
+    oid = ObjectId(ObjectId.from_datetime(created).binary[:4] + ObjectId().binary[4:])
+    return {
+        "_id": oid,
+        "location": location,
+        "bloodType": blood_type,
+        "unitsNeeded": units,
+        "datePosted": (date_posted or created).replace(tzinfo=None)
+    }
+
+
+def totals(aggregates, city="Lahore", blood_type="A+"):
+    for doc in aggregates.summaries(now):
+        if doc["city"] == city and doc["bloodType"] == blood_type:
+            return doc
+
+
+# --- Ring buffer indexing ---
+ring = RingBuffer(4, cities=1)
+ring.add(np.array([0, 0]), np.array([0, 0]), np.array([10, 12]), np.array([1, 2]))
+check("ring buffer orders buckets oldest -> newest", ring.series()[0, 0].tolist() == [0, 1, 0, 2])
+ring.advance(14)
+check("advancing clears buckets that leave the window", ring.series()[0, 0].tolist() == [0, 2, 0, 0])
+ring.add(np.array([0, 0]), np.array([0, 0]), np.array([9, 14]), np.array([5, 3]))
+check("requests older than the window are dropped", ring.series()[0, 0].tolist() == [0, 2, 0, 3])
+ring.advance(100)
+check("advancing past the whole window empties it", ring.series().sum() == 0)
+
+# --- Overlap window: re-read requests are counted once, late lower ids are not lost ---
+aggregates = DemandAggregates()
+first = blood_request(now - timedelta(minutes=20), 3)
+second = blood_request(now - timedelta(minutes=5), 2)
+aggregates.update([first, second], now)
+late = blood_request(now - timedelta(minutes=10), 4)
+since = aggregates.query()["_id"]["$gte"]
+reread = [r for r in (first, second, late) if r["_id"] >= since]
+counted = aggregates.update(reread, now)
+aggregates.advance_to(now)
+check("overlap re-read only folds the late request", counted == 1, f"(folded {counted})")
+check("late request with a lower _id is counted once", totals(aggregates)["unitsThisHour"] == 9,
+      f"(got {totals(aggregates)['unitsThisHour']})")
+
+restored = DemandAggregates.from_document(aggregates.to_document())
+check("saved state round-trips", (restored.hourly.data == aggregates.hourly.data).all()
+      and restored.recent_ids == aggregates.recent_ids)
+
+# --- A future datePosted cannot move the windows ahead of the clock ---
+aggregates = DemandAggregates()
+aggregates.update([blood_request(now - timedelta(hours=2), 3)], now)
+aggregates.update([blood_request(now - timedelta(minutes=1), 1, date_posted=datetime(2027, 1, 1, tzinfo=timezone.utc))], now)
+aggregates.update([blood_request(now, 5)], now)
+aggregates.advance_to(now)
+summary = totals(aggregates)
+check("future-dated request does not wipe earlier units", summary["unitsLast24Hours"] == 9,
+      f"(got {summary['unitsLast24Hours']})")
+check("head never moves past the current hour", aggregates.hourly.head == int(now.timestamp()) // 3600)
+
+# --- Forecasts against a simple baseline ---
+aggregates = DemandAggregates()
+aggregates.update([blood_request(now - timedelta(hours=2), 3)], now)
+aggregates.advance_to(now)
+summary = totals(aggregates)
+check("a single request does not dominate the 24h forecast",
+      summary["forecastNext24Hours"] <= 1.5 * summary["unitsLast24Hours"],
+      f"(forecast {summary['forecastNext24Hours']} vs last 24h {summary['unitsLast24Hours']})")
+
+rng = np.random.default_rng(0)
+aggregates = DemandAggregates()
+steady = []
+for hours_ago in range(1, 24 * 7):
+    for _ in range(rng.poisson(2)):
+        steady.append(blood_request(now - timedelta(hours=hours_ago), 1))
+aggregates.update(steady, now)
+aggregates.advance_to(now)
+summary = totals(aggregates)
+baseline = summary["unitsLast7Days"] / 7
+check("steady demand forecast is close to the 7-day daily mean",
+      abs(summary["forecastNext24Hours"] - baseline) <= 0.25 * baseline,
+      f"(forecast {summary['forecastNext24Hours']} vs baseline {baseline:.1f})")
+
+# --- Free-text locations map to a fixed city list ---
+aggregates = DemandAggregates()
+aggregates.update([blood_request(now, 1, location=f"Village {i}") for i in range(500)]
+                  + [blood_request(now, 2, location="lahore, Pakistan")], now)
+aggregates.advance_to(now)
+check("unknown locations go to 'Other' and the buffers stay fixed size",
+      aggregates.hourly.data.shape[0] == len(CITIES) and totals(aggregates, "Other")["unitsThisHour"] == 500
+      and totals(aggregates)["unitsThisHour"] == 2)
+
+if failures:
+    print(f"❌ {len(failures)} blood demand forecaster checks failed")
+else:
+    print("✅ Blood demand forecaster checks passed - Test Passed")
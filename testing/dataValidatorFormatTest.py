@@ -0,0 +1,41 @@
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from data_validator import validate_file
+
+# The same records must produce the same report whether they are stored as a JSON
+# array or as JSON lines, including bad dates and missing ids / blood types.
+records = [
+    {"requestId": "req1", "bloodType": "A+", "urgencyLevel": "Critical", "location": "Lahore",
+     "datePosted": "2025-04-01T12:00:00Z", "unitsNeeded": 4},
+    {"requestId": None, "bloodType": None, "urgencyLevel": "Urgent", "location": "Karachi",
+     "datePosted": "garbage", "unitsNeeded": 2},
+    {"requestId": None, "bloodType": "C+", "urgencyLevel": "Normal", "location": "Quetta",
+     "datePosted": "2025-04-01T14:45:00Z", "unitsNeeded": 1},
+]
+
+expected = {"datePosted_unparseable", "requestId_missing", "bloodType_missing", "bloodType_invalid"}
+
+with tempfile.TemporaryDirectory() as tmp:
+    array_path = os.path.join(tmp, "requests_array.json")
+    lines_path = os.path.join(tmp, "requests_lines.json")
+    with open(array_path, "w", encoding="utf-8") as f:
+        json.dump(records, f)
+    with open(lines_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+    array_issues = validate_file(array_path, workers=1)["issues"]
+    lines_issues = validate_file(lines_path, workers=1)["issues"]
+
+if array_issues != lines_issues:
+    print("❌ JSON array and JSON lines reports differ - Test Failed")
+    print(f"🔍 Array: {array_issues}")
+    print(f"🔍 Lines: {lines_issues}")
+elif set(array_issues) != expected:
+    print(f"❌ Expected issues {sorted(expected)}, got {sorted(array_issues)} - Test Failed")
+else:
+    print("✅ JSON array and JSON lines give the same validation report - Test Passed")
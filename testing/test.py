@@ -10,7 +10,9 @@ test_files = [
     "medicalCardTest.py",
     "hospitalResourceUpdateTest.py",
     "addBloodRequestTest.py",
-    "acceptBloodRequestTest.py"
+    "acceptBloodRequestTest.py",
+    "dataValidatorFormatTest.py",
+    "bloodDemandForecasterTest.py"
 ]
 
 for test in test_files:
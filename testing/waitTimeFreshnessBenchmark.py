@@ -0,0 +1,228 @@
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+
+import numpy as np
+from pymongo import MongoClient
+
+# Measures how long it takes from a hospital admin changing icu_beds (the flow in
+# hospitalResourceUpdateTest.py) until WaitTimePredictor.py has written new wait_times.
+#
+# Point --mongo-uri at a local, throwaway mongod: the benchmark database is dropped
+# and re-seeded for every run.
+
+SENTINEL = "pending"
+PREDICTOR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend", "WaitTimePredictor.py")
+
+city_coordinates = {
+    'Lahore': [74.3295, 31.5470],
+    'Karachi': [67.0011, 24.8607],
+    'Islamabad': [73.0479, 33.6844],
+    'Peshawar': [71.5249, 34.0150],
+    'Multan': [71.4734, 30.1575],
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Resource change -> wait time freshness benchmark")
+    parser.add_argument("--mongo-uri", default=os.getenv("BENCH_MONGO_URI", "mongodb://localhost:27017"))
+    parser.add_argument("--db", default="emcon_freshness_bench")
+    parser.add_argument("--fleet-sizes", default="100,1000,5000", help="comma separated hospital counts")
+    parser.add_argument("--intervals", default="5", help="comma separated PREDICTION_INTERVAL values (seconds)")
+    parser.add_argument("--rate", type=float, default=20.0, help="resource updates per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of updates per run")
+    parser.add_argument("--poll-ms", type=float, default=20.0, help="how often pending updates are checked")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.db == "test":
+        parser.error("refusing to benchmark against the 'test' database used by the live predictor")
+    return args
+
+
+def seed_hospitals(collection, count):
+    collection.drop()
+    cities = list(city_coordinates)
+    docs = []
+    for i in range(count):
+        city = cities[i % len(cities)]
+        docs.append({
+            "name": f"{city} Benchmark Hospital {i}",
+            "location": {"type": "Point", "coordinates": city_coordinates[city]},
+            "resources": {
+                "icu_beds": random.randint(10, 100),
+                "ventilators": random.randint(1, 20)
+            },
+            "wait_times": {"emergency": "Unknown", "general": "Unknown"}
+        })
+    # Only the benchmark changes resources, so the current icu_beds can be tracked locally
+    icu_beds = {}
+    for start in range(0, count, 5000):
+        batch = docs[start:start + 5000]
+        for doc, inserted_id in zip(batch, collection.insert_many(batch).inserted_ids):
+            icu_beds[inserted_id] = doc["resources"]["icu_beds"]
+    return icu_beds
+
+
+def start_predictor(mongo_uri, db_name, interval):
+    env = dict(os.environ, MONGO_URI=mongo_uri, MONGO_DB=db_name, PREDICTION_INTERVAL=str(interval))
+    return subprocess.Popen(
+        [sys.executable, PREDICTOR_PATH],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def wait_for_pass(collection, predictor, timeout, poll_period):
+    # Waits until the predictor has rewritten every "Unknown" wait time and returns
+    # when the first and the last of those writes were seen (to within poll_period)
+    total = collection.count_documents({"wait_times.general": "Unknown"})
+    first_write = None
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predictor.poll() is not None:
+            raise RuntimeError(f"predictor exited with code {predictor.returncode}")
+        remaining = collection.count_documents({"wait_times.general": "Unknown"})
+        now = time.monotonic()
+        if first_write is None and remaining < total:
+            first_write = now
+        if remaining == 0:
+            return first_write or now, now
+        time.sleep(poll_period)
+    raise TimeoutError("predictor did not finish a pass in time")
+
+
+def measure_pass_time(collection, predictor, timeout, poll_period):
+    # The first pass includes interpreter startup and model fitting, so only use it to
+    # get the predictor going. Right after it finishes the predictor is asleep, so
+    # resetting every wait time then lets the next pass be timed on its own.
+    wait_for_pass(collection, predictor, timeout, poll_period)
+    collection.update_many({}, {"$set": {"wait_times.general": "Unknown", "wait_times.emergency": "Unknown"}})
+    first_write, last_write = wait_for_pass(collection, predictor, timeout, poll_period)
+    return max(last_write - first_write, poll_period)
+
+
+def run_updates(collection, icu_beds, args, drain_timeout):
+    # Each change also resets wait_times to a sentinel, so the first write by the
+    # predictor after the change is visible as the sentinel disappearing.
+    ids = list(icu_beds)
+    pending = {}
+    lags = []
+    sent = 0
+    skipped = 0
+    period = 1.0 / args.rate
+    poll_period = args.poll_ms / 1000.0
+
+    start = time.monotonic()
+    stop_sending = start + args.duration
+    next_send = start
+    next_poll = start
+
+    while True:
+        now = time.monotonic()
+        if now >= stop_sending and (not pending or now >= stop_sending + drain_timeout):
+            break
+
+        if now < stop_sending and now >= next_send:
+            hospital_id = random.choice(ids)
+            if hospital_id not in pending:
+                # Same ranges as hospitalResourceUpdateTest.py. icu_beds must actually change,
+                # otherwise WaitTimePredictor.py cannot tell a stale prediction from a fresh
+                # one and a write from an older pass would clear the sentinel.
+                new_icu_beds = icu_beds[hospital_id]
+                while new_icu_beds == icu_beds[hospital_id]:
+                    new_icu_beds = random.randint(10, 100)
+                icu_beds[hospital_id] = new_icu_beds
+                collection.update_one(
+                    {"_id": hospital_id},
+                    {"$set": {
+                        "resources.icu_beds": new_icu_beds,
+                        "resources.ventilators": random.randint(1, 20),
+                        "wait_times.general": SENTINEL,
+                        "wait_times.emergency": SENTINEL
+                    }}
+                )
+                pending[hospital_id] = time.monotonic()
+                sent += 1
+            else:
+                # The hospital's last change has not landed yet; this lowers the real rate
+                skipped += 1
+            next_send += period
+
+        if now >= next_poll and pending:
+            fresh = collection.find(
+                {"_id": {"$in": list(pending)}, "wait_times.general": {"$ne": SENTINEL}},
+                {"_id": 1}
+            )
+            seen_at = time.monotonic()
+            for doc in fresh:
+                lags.append(seen_at - pending.pop(doc["_id"]))
+            next_poll = seen_at + poll_period
+
+        wake = next_poll if now >= stop_sending else min(next_send, next_poll)
+        time.sleep(max(0.0, wake - time.monotonic()))
+
+    drain_time = max(0.0, time.monotonic() - stop_sending)
+    return {
+        "sent": sent,
+        "skipped": skipped,
+        "actual_rate": sent / args.duration,
+        "lags": np.array(lags),
+        "unresolved": len(pending),
+        "drain_time": drain_time
+    }
+
+
+def report(fleet_size, interval, pass_time, result):
+    lags = result["lags"]
+    if len(lags):
+        p50, p90, p99 = np.percentile(lags, [50, 90, 99])
+        lag_text = f"p50={p50:.2f}s p90={p90:.2f}s p99={p99:.2f}s max={lags.max():.2f}s"
+    else:
+        lag_text = "no fresh writes observed"
+    print(
+        f"📊 fleet={fleet_size:>7} interval={interval:>5}s | "
+        f"predictor pass={pass_time:.2f}s ({fleet_size / pass_time:.0f} hospitals/s) | "
+        f"sent={result['sent']} ({result['actual_rate']:.1f}/s, {result['skipped']} skipped) "
+        f"fresh={len(lags)} unresolved={result['unresolved']} drain={result['drain_time']:.1f}s | {lag_text}"
+    )
+
+
+def main():
+    args = parse_args()
+    random.seed(args.seed)
+    fleet_sizes = [int(size) for size in args.fleet_sizes.split(",")]
+    intervals = [float(interval) for interval in args.intervals.split(",")]
+
+    client = MongoClient(args.mongo_uri)
+    collection = client[args.db]["hospitals"]
+
+    print(f"⏱️ Freshness benchmark: {args.rate} updates/s for {args.duration}s, polling every {args.poll_ms}ms")
+    for interval in intervals:
+        for fleet_size in fleet_sizes:
+            icu_beds = seed_hospitals(collection, fleet_size)
+            predictor = start_predictor(args.mongo_uri, args.db, interval)
+            try:
+                pass_time = measure_pass_time(
+                    collection, predictor,
+                    timeout=max(60.0, fleet_size * 0.01) + interval,
+                    poll_period=args.poll_ms / 1000.0
+                )
+                # A change can just miss a pass, so allow a full sleep plus two passes to land
+                drain_timeout = interval + 2 * pass_time + 5.0
+                result = run_updates(collection, icu_beds, args, drain_timeout)
+                report(fleet_size, interval, pass_time, result)
+            finally:
+                predictor.terminate()
+                predictor.wait()
+
+    client.drop_database(args.db)
+    client.close()
+
+
+if __name__ == "__main__":
+    main()